@@ -0,0 +1,24 @@
+"""
+Pytest configuration for the API test suite
+"""
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests that need exclusive access to the database when running in parallel
+
+    Tests marked with ``serial`` assert on the global state of the API (e.g. an
+    empty database). Under pytest-xdist with more than one worker, other workers
+    create entries concurrently, so these tests can only be run serially.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None or workerinput.get("workercount", 1) <= 1:
+        return
+
+    skip_serial = pytest.mark.skip(
+        reason="requires exclusive access to the database; run without -n to include it"
+    )
+    for item in items:
+        if "serial" in item.keywords:
+            item.add_marker(skip_serial)
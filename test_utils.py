@@ -1,19 +1,81 @@
 """
 Utility functions for API testing
 """
-import uuid
+import re
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Sequence
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib decoder used by requests
+    orjson = None
 
-def create_test_entry(base_url: str, text: str) -> Dict[str, Any]:
+
+_UUID_RE = re.compile(
+    r'\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z', re.IGNORECASE
+)
+
+# Fields every entry returned by the API carries as strings
+_ENTRY_STRING_FIELDS = ('id', 'text', 'createdAt')
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session with a keep-alive connection pool and retries disabled
+    
+    Returns:
+        Session with the pooled adapter mounted for http:// and https://
+    """
+    session = requests.Session()
+    # Never retry: negative-path tests expect the first response, and retries would hide flaky servers
+    adapter = HTTPAdapter(
+        pool_connections=32, pool_maxsize=64,
+        max_retries=Retry(total=0, connect=0, read=0, redirect=0)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session used by the helpers when no session is passed in
+_SESSION = create_session()
+
+# Upper bound on concurrent requests issued by the batch helpers, to avoid hammering the dev server
+_MAX_PARALLEL = 8
+
+
+def _client(session: Optional[requests.Session]) -> requests.Session:
+    """Return the session to send requests on, falling back to the shared module session"""
+    return session if session is not None else _SESSION
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode the JSON body of a response using orjson, or response.json() if it is not installed
+    
+    Args:
+        response: HTTP response to decode
+        
+    Returns:
+        Decoded JSON body (dict, list or scalar)
+    """
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def create_test_entry(base_url: str, text: str, session: Optional[requests.Session] = None) -> Dict[str, Any]:
     """
     Helper function to create a test journal entry
     
     Args:
         base_url: Base URL of the API
         text: Text content for the journal entry
+        session: Optional session to send the request on (defaults to the shared pooled session)
         
     Returns:
         Dictionary containing the created entry data
@@ -22,49 +84,51 @@ def create_test_entry(base_url: str, text: str) -> Dict[str, Any]:
         AssertionError: If entry creation fails
     """
     entry_data = {"text": text}
-    response = requests.post(f"{base_url}/entries", json=entry_data)
+    response = _client(session).post(f"{base_url}/entries", json=entry_data)
     
     assert response.status_code == 201, f"Failed to create test entry: {response.status_code}"
     
-    data = response.json()
+    data = parse_json(response)
     assert 'id' in data, "Created entry should have ID"
     
     return data
 
 
-def get_entry_by_id(base_url: str, entry_id: str) -> Optional[Dict[str, Any]]:
+def get_entry_by_id(base_url: str, entry_id: str, session: Optional[requests.Session] = None) -> Optional[Dict[str, Any]]:
     """
     Helper function to get an entry by ID
     
     Args:
         base_url: Base URL of the API
         entry_id: ID of the entry to retrieve
+        session: Optional session to send the request on (defaults to the shared pooled session)
         
     Returns:
         Entry data if found, None if not found
     """
-    response = requests.get(f"{base_url}/entries/{entry_id}")
+    response = _client(session).get(f"{base_url}/entries/{entry_id}")
     
     if response.status_code == 200:
-        return response.json()
+        return parse_json(response)
     elif response.status_code == 404:
         return None
     else:
         raise AssertionError(f"Unexpected status code when getting entry: {response.status_code}")
 
 
-def delete_entry_by_id(base_url: str, entry_id: str) -> bool:
+def delete_entry_by_id(base_url: str, entry_id: str, session: Optional[requests.Session] = None) -> bool:
     """
     Helper function to delete an entry by ID
     
     Args:
         base_url: Base URL of the API
         entry_id: ID of the entry to delete
+        session: Optional session to send the request on (defaults to the shared pooled session)
         
     Returns:
         True if deleted successfully, False if not found
     """
-    response = requests.delete(f"{base_url}/entries/{entry_id}")
+    response = _client(session).delete(f"{base_url}/entries/{entry_id}")
     
     if response.status_code == 204:
         return True
@@ -74,9 +138,24 @@ def delete_entry_by_id(base_url: str, entry_id: str) -> bool:
         raise AssertionError(f"Unexpected status code when deleting entry: {response.status_code}")
 
 
+def _delete_best_effort(base_url: str, entry_id: str, session: Optional[requests.Session] = None):
+    """
+    Delete an entry for cleanup, ignoring the response status
+    
+    Entries might already have been deleted by the test itself, so a 404 or
+    any other status is not an error here.
+    
+    Args:
+        base_url: Base URL of the API
+        entry_id: ID of the entry to delete
+        session: Optional session to send the request on (defaults to the shared pooled session)
+    """
+    _client(session).delete(f"{base_url}/entries/{entry_id}")
+
+
 def validate_uuid(uuid_string: str) -> bool:
     """
-    Validate if a string is a valid UUID
+    Validate if a string is a valid UUID in canonical 8-4-4-4-12 hex form
     
     Args:
         uuid_string: String to validate
@@ -84,11 +163,7 @@ def validate_uuid(uuid_string: str) -> bool:
     Returns:
         True if valid UUID, False otherwise
     """
-    try:
-        uuid.UUID(uuid_string)
-        return True
-    except ValueError:
-        return False
+    return isinstance(uuid_string, str) and _UUID_RE.match(uuid_string) is not None
 
 
 def validate_iso_date(date_string: str) -> bool:
@@ -108,41 +183,75 @@ def validate_iso_date(date_string: str) -> bool:
         return False
 
 
-def create_entries_with_moods(base_url: str, entries_data: List[Dict[str, str]]) -> List[str]:
+def parse_iso_datetime(date_string: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp into a timezone-aware datetime
+    
+    Timestamps without an offset are treated as UTC so they can be compared
+    with aware bounds.
+    
+    Args:
+        date_string: ISO 8601 timestamp, e.g. "2025-06-22T16:45:00Z"
+        
+    Returns:
+        Timezone-aware datetime
+    """
+    # fromisoformat only accepts a trailing 'Z' from Python 3.11 on
+    parsed = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def create_entries_with_moods(base_url: str, entries_data: Sequence[Dict[str, str]],
+                              session: Optional[requests.Session] = None) -> List[str]:
     """
     Helper function to create multiple entries with specific text content
     
+    The entries are independent, so the POST requests are issued concurrently
+    and the total setup time is close to a single round trip.
+    
     Args:
         base_url: Base URL of the API
-        entries_data: List of dictionaries with 'text' field
+        entries_data: Sequence (list or tuple) of dictionaries with 'text' field
+        session: Optional session to send the requests on (defaults to the shared pooled session)
         
     Returns:
-        List of created entry IDs
+        List of created entry IDs, in the same order as entries_data
     """
-    created_ids = []
+    if not entries_data:
+        return []
     
-    for entry_data in entries_data:
-        response = requests.post(f"{base_url}/entries", json=entry_data)
+    client = _client(session)
+    
+    def create(entry_data: Dict[str, str]) -> str:
+        response = client.post(f"{base_url}/entries", json=entry_data)
         assert response.status_code == 201, f"Failed to create test entry: {response.status_code}"
-        created_ids.append(response.json()['id'])
+        return parse_json(response)['id']
     
-    return created_ids
+    with ThreadPoolExecutor(max_workers=min(len(entries_data), _MAX_PARALLEL)) as executor:
+        return list(executor.map(create, entries_data))
 
 
-def cleanup_test_entries(base_url: str, entry_ids: List[str]):
+def cleanup_test_entries(base_url: str, entry_ids: List[str], session: Optional[requests.Session] = None):
     """
     Helper function to clean up test entries
     
+    The DELETE requests are independent and are issued concurrently.
+    
     Args:
         base_url: Base URL of the API
         entry_ids: List of entry IDs to delete
+        session: Optional session to send the requests on (defaults to the shared pooled session)
     """
-    for entry_id in entry_ids:
-        try:
-            delete_entry_by_id(base_url, entry_id)
-        except AssertionError:
-            # Entry might already be deleted, ignore
-            pass
+    if not entry_ids:
+        return
+    
+    def delete(entry_id: str):
+        _delete_best_effort(base_url, entry_id, session=session)
+    
+    with ThreadPoolExecutor(max_workers=min(len(entry_ids), _MAX_PARALLEL)) as executor:
+        list(executor.map(delete, entry_ids))
 
 
 def assert_valid_entry_structure(entry: Dict[str, Any]):
@@ -153,13 +262,14 @@ def assert_valid_entry_structure(entry: Dict[str, Any]):
         entry: Entry data to validate
     """
     assert isinstance(entry, dict), f"Entry should be a dictionary, but got {type(entry)}"
-    assert 'id' in entry, "Entry should have 'id' field"
-    assert 'text' in entry, "Entry should have 'text' field"
-    assert 'createdAt' in entry, "Entry should have 'createdAt' field"
     
-    assert isinstance(entry['id'], str), f"Entry ID should be string, but got {type(entry['id'])}"
-    assert isinstance(entry['text'], str), f"Entry text should be string, but got {type(entry['text'])}"
-    assert isinstance(entry['createdAt'], str), f"Entry createdAt should be string, but got {type(entry['createdAt'])}"
+    # id, text and createdAt must all be present as strings
+    invalid_fields = {
+        field: type(entry[field]).__name__ if field in entry else 'missing'
+        for field in _ENTRY_STRING_FIELDS
+        if not isinstance(entry.get(field), str)
+    }
+    assert not invalid_fields, f"Entry fields should be strings, but got: {invalid_fields}"
     
     # Validate UUID format
     assert validate_uuid(entry['id']), f"Entry ID '{entry['id']}' is not a valid UUID"
@@ -168,6 +278,22 @@ def assert_valid_entry_structure(entry: Dict[str, Any]):
     assert validate_iso_date(entry['createdAt']), f"Entry createdAt '{entry['createdAt']}' is not a valid ISO date"
 
 
+def assert_valid_mood_summary(summary: Dict[str, Any]):
+    """
+    Assert that a mood summary maps mood labels to positive integer counts
+    
+    Args:
+        summary: Mood summary data to validate
+    """
+    # type() rather than isinstance(), so JSON booleans are not accepted as counts
+    invalid_items = [
+        (mood, count) for mood, count in summary.items()
+        if not (type(mood) is str and type(count) is int and count > 0)
+    ]
+    assert not invalid_items, \
+        f"Mood summary should map mood strings to positive integer counts, but got invalid items: {invalid_items}"
+
+
 def assert_valid_error_response(response_data: Dict[str, Any]):
     """
     Assert that an error response has the correct structure
@@ -178,4 +304,19 @@ def assert_valid_error_response(response_data: Dict[str, Any]):
     assert isinstance(response_data, dict), f"Error response should be a dictionary, but got {type(response_data)}"
     assert 'error' in response_data, "Error response should contain 'error' field"
     assert isinstance(response_data['error'], str), f"Error message should be string, but got {type(response_data['error'])}"
-    assert len(response_data['error']) > 0, "Error message should not be empty" 
\ No newline at end of file
+    assert len(response_data['error']) > 0, "Error message should not be empty" 
+
+
+def assert_json_response(response: requests.Response) -> Any:
+    """
+    Assert that a response has a JSON content type and return its decoded body
+    
+    Args:
+        response: HTTP response to validate
+        
+    Returns:
+        Decoded JSON body
+    """
+    content_type = response.headers.get('content-type', '')
+    assert content_type.startswith('application/json'), f"Expected JSON content type, but got {content_type}"
+    return parse_json(response)